@@ -1,10 +1,14 @@
 # app.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Body, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
-import requests
-import pandas as pd
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from cachetools import TTLCache
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
+import httpx
+import asyncio
+import csv
+import re
 from pathlib import Path
 from dotenv import load_dotenv
 import os
@@ -18,15 +22,79 @@ if not FMCSA_API_KEY:
     raise ValueError("FMCSA_API_KEY must be set in environment variables")
 
 # Constants
-FMCSA_BASE_URL = "https://mobile.fmcsa.dot.gov/qc/services/carriers/"
+FMCSA_HOST_URL = "https://mobile.fmcsa.dot.gov/"
+FMCSA_BASE_URL = f"{FMCSA_HOST_URL}qc/services/carriers/"
+FMCSA_WARM_UP_TIMEOUT = 2.0
+MC_NUMBER_RE = re.compile(r'^\s*(?:MC-?\s*)?([0-9]+)\s*$', re.IGNORECASE)
+MAX_BULK_MC_NUMBERS = 100
+FMCSA_MAX_CONCURRENT_REQUESTS = 20
+
+# Agent instructions returned with every validated carrier; only the carrier name varies
+NEXT_STEPS_1 = "Confirm you found the right carrier name. Ask user exactly this: '{name}?'. Then wait for user to respond."
+NEXT_STEPS_2A = "If user confirms: move on to finding available loads, MAKE SURE you do not give them load information until you have verified they work for the carrier {name}."
+NEXT_STEPS_2B = "It is possible that you may have transcribed the name incorrectly, so use your best judgement to decide if the name the caller gives is close enough to the carrier name you have. If so, you can consider it a match and move on to finding available loads."
+NEXT_STEPS_2C = "If user denies: first, you must ask the user to repeat the name of the carrier they work for ('I'm sorry, I didn't quite catch that. What's the name of the carrier you work for?'). Wait for the user to provide the name again and check if it matches the carrier name you have."
+NEXT_STEPS_2D = "If you still cannot verify the carrier name, ask the user for their MC / DOT number ('I'm sorry, what's that MC number again?'). Wait for user to provide number again. Then search for the carrier again with new number the caller provides."
+
+LOADS_CSV_PATH = Path(__file__).parent / "loads.csv"
+MAX_BULK_REFERENCE_NUMBERS = 100
+REQUIRED_LOAD_FIELDS = ['reference_number', 'origin', 'destination', 'equipment_type', 'rate', 'commodity']
+
+# Prebuilt errors for input-validation failures, reused so bad requests don't allocate a new
+# exception each time; raised with with_traceback(None) so tracebacks don't accumulate on reuse
+MC_NUMBER_REQUIRED_ERROR = HTTPException(
+    status_code=400,
+    detail="MC number is required"
+)
+INVALID_MC_NUMBER_ERROR = HTTPException(
+    status_code=400,
+    detail="Invalid MC number format. Must contain only digits after removing 'MC-' prefix"
+)
+INVALID_REFERENCE_NUMBER_ERROR = HTTPException(
+    status_code=400,
+    detail="Invalid reference number format. Must start with 'LOAD'"
+)
+
+
+# Response models are immutable and reject unknown fields; cached instances are returned as-is
+class FrozenModel(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
 # Models for carrier validation
-class CarrierResponse(BaseModel):
+class CarrierInfo(FrozenModel):
+    carrier_id: str
+    status: str
+    carrier_name: str
+    dot_number: str
+    mc_number: str
+    status_reason: Optional[str] = None
+
+class NextStepsFollowUp(FrozenModel):
+    a: str
+    b: str
+    c: str
+    d: str
+
+class NextSteps(FrozenModel):
+    confirm_carrier: str = Field(alias="1")
+    follow_up: NextStepsFollowUp = Field(alias="2")
+
+class CarrierData(FrozenModel):
+    carrier: CarrierInfo
+    transfer_contact: Optional[str] = None
+    next_steps: NextSteps
+
+class CarrierResponse(FrozenModel):
     success: bool
-    data: Dict[str, Any]
+    data: CarrierData
+
+class BulkCarrierResult(FrozenModel):
+    success: bool
+    data: Optional[CarrierData] = None
+    error: Optional[str] = None
 
 # Models for load details
-class LoadDetails(BaseModel):
+class LoadDetails(FrozenModel):
     reference_number: str
     origin: str
     destination: str
@@ -34,12 +102,31 @@ class LoadDetails(BaseModel):
     rate: float
     commodity: str
 
-class LoadResponse(BaseModel):
+class LoadResponse(FrozenModel):
     success: bool
     data: Optional[LoadDetails] = None
     error: Optional[str] = None
 
-app = FastAPI()
+class LoadsResponse(FrozenModel):
+    success: bool
+    data: List[LoadDetails] = []
+    not_found: List[str] = []
+    errors: Dict[str, str] = {}
+
+# One parse of loads.csv; replaced as a whole so readers never see a half-updated index
+class LoadIndex(NamedTuple):
+    mtime: Optional[float]
+    loads: Dict[str, LoadDetails]
+    errors: Dict[str, str]
+    error: Optional[HTTPException] = None
+
+# Successful FMCSA carrier lookups keyed by MC number; carrier data changes on the order of days
+CARRIER_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+# MC numbers FMCSA reported as not found, mapped to the error detail, so repeated bogus lookups skip the upstream
+CARRIER_NOT_FOUND_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -49,92 +136,159 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def validate_mc_number(mc_number: str) -> CarrierResponse:
-    """Validate MC number using the FMCSA API"""
-    if not FMCSA_API_KEY:
-        raise HTTPException(
-            status_code=500,
-            detail="FMCSA API key not configured"
+async def load_loads_csv():
+    """Build the in-memory load index off the event loop"""
+    try:
+        await current_loads()
+    except HTTPException as e:
+        print(f"Load data not cached at startup: {e.detail}")
+
+async def warm_fmcsa_client():
+    """Prime DNS, TCP and TLS state for FMCSA in the shared HTTP client"""
+    try:
+        # Short timeout so an unreachable FMCSA doesn't hold up startup
+        response = await app.state.http.head(FMCSA_HOST_URL, timeout=FMCSA_WARM_UP_TIMEOUT)
+        print(f"FMCSA connection warmed up over {response.http_version}")
+    except httpx.HTTPError as e:
+        print(f"FMCSA warm-up request failed: {str(e)}")
+
+@app.on_event("startup")
+async def startup():
+    """Create the shared HTTP client, then load data and warm up FMCSA in parallel"""
+    # Shared HTTP client for FMCSA requests so connections are pooled; with HTTP/2 concurrent
+    # lookups are multiplexed as streams over a few TLS connections instead of one each.
+    # The pool matches the FMCSA semaphore so requests never queue for a connection, even if
+    # FMCSA only negotiates HTTP/1.1
+    app.state.fmcsa_semaphore = asyncio.Semaphore(FMCSA_MAX_CONCURRENT_REQUESTS)
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(
+            max_connections=FMCSA_MAX_CONCURRENT_REQUESTS,
+            max_keepalive_connections=FMCSA_MAX_CONCURRENT_REQUESTS
         )
+    )
+    # In-memory load index keyed by reference number, rebuilt when loads.csv changes
+    app.state.load_index = LoadIndex(mtime=None, loads={}, errors={})
+    app.state.loads_lock = asyncio.Lock()
 
-    # Validate input format
-    if not mc_number:
+    await asyncio.gather(load_loads_csv(), warm_fmcsa_client())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the shared HTTP client"""
+    await app.state.http.aclose()
+
+async def fetch_carrier_data(clean_mc: str) -> Dict[str, Any]:
+    """
+    Fetch carrier data from the FMCSA API, caching successful lookups
+    """
+    carrier_data = CARRIER_CACHE.get(clean_mc)
+    if carrier_data is not None:
+        return carrier_data
+
+    not_found_detail = CARRIER_NOT_FOUND_CACHE.get(clean_mc)
+    if not_found_detail is not None:
         raise HTTPException(
-            status_code=400,
-            detail="MC number is required"
+            status_code=404,
+            detail=not_found_detail
         )
 
-    clean_mc = mc_number.upper().replace('MC-', '').strip()
+    url = f"{FMCSA_BASE_URL}{clean_mc}?webKey={FMCSA_API_KEY}"
     
-    # Validate MC number format
-    if not clean_mc.isdigit():
+    try:
+        # Bound in-flight FMCSA requests across all callers so we don't overwhelm the upstream
+        async with app.state.fmcsa_semaphore:
+            response = await app.state.http.get(url)
+        print(url, response)
+    except httpx.TimeoutException:
         raise HTTPException(
-            status_code=400,
-            detail="Invalid MC number format. Must contain only digits after removing 'MC-' prefix"
+            status_code=504,
+            detail="FMCSA API request timed out"
+        )
+    
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Error connecting to FMCSA API: {str(e)}"
+        )
+    
+    # Handle different HTTP status codes
+    if response.status_code == 404:
+        detail = f"Carrier with MC number {clean_mc} not found"
+        CARRIER_NOT_FOUND_CACHE[clean_mc] = detail
+        raise HTTPException(
+            status_code=404,
+            detail=detail
+        )
+    elif response.status_code == 401:
+        raise HTTPException(
+            status_code=502,
+            detail="Invalid FMCSA API key"
+        )
+    elif response.status_code != 200:
+        raise HTTPException(
+            status_code=502,
+            detail=f"FMCSA API error: {response.status_code}"
         )
     
     try:
-        url = f"{FMCSA_BASE_URL}{clean_mc}?webKey={FMCSA_API_KEY}"
-        
-        try:
-            response = requests.get(url, timeout=10)  # Add timeout
-            print(url, response)
-        except requests.exceptions.Timeout:
-            raise HTTPException(
-                status_code=504,
-                detail="FMCSA API request timed out"
-            )
-        
-        except requests.exceptions.RequestException as e:
-            raise HTTPException(
-                status_code=502,
-                detail=f"Error connecting to FMCSA API: {str(e)}"
-            )
-        
-        # Handle different HTTP status codes
-        if response.status_code == 404:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Carrier with MC number {clean_mc} not found"
-            )
-        elif response.status_code == 401:
-            raise HTTPException(
-                status_code=502,
-                detail="Invalid FMCSA API key"
-            )
-        elif response.status_code != 200:
-            raise HTTPException(
-                status_code=502,
-                detail=f"FMCSA API error: {response.status_code}"
-            )
-        
-        try:
-            data = response.json()
-        except ValueError:
-            raise HTTPException(
-                status_code=502,
-                detail="Invalid JSON response from FMCSA API"
-            )
-        if not data.get('content', {}):
-            raise HTTPException(
-                status_code=404,
-                detail=f"No carrier data found for MC number: {clean_mc}"
-            )  
-        # Extract carrier information from the correct response structure
-        carrier_data = data.get('content', {}).get('carrier', {})
-        
+        data = response.json()
+    except ValueError:
+        raise HTTPException(
+            status_code=502,
+            detail="Invalid JSON response from FMCSA API"
+        )
+    if not data.get('content', {}):
+        detail = f"No carrier data found for MC number: {clean_mc}"
+        CARRIER_NOT_FOUND_CACHE[clean_mc] = detail
+        raise HTTPException(
+            status_code=404,
+            detail=detail
+        )
+    # Extract carrier information from the correct response structure
+    carrier_data = data.get('content', {}).get('carrier', {})
+    
+    # Validate required fields
+    carrier_name = carrier_data.get('legalName', carrier_data.get('dbaName', ''))
+    dot_number = carrier_data.get('dotNumber')
+    
+    if not carrier_name or not dot_number:
+        raise HTTPException(
+            status_code=502,
+            detail="Incomplete carrier data received from FMCSA API"
+        )
 
-        
-        # Validate required fields
+    CARRIER_CACHE[clean_mc] = carrier_data
+    return carrier_data
+
+def clean_mc_number(mc_number: str) -> str:
+    """Validate the format of an MC number and return just its digits"""
+    # Validate input format
+    if not mc_number:
+        raise MC_NUMBER_REQUIRED_ERROR.with_traceback(None)
+
+    # Validate MC number format and extract the digits in a single match
+    match = MC_NUMBER_RE.match(mc_number)
+    if not match:
+        raise INVALID_MC_NUMBER_ERROR.with_traceback(None)
+    return match.group(1)
+
+async def validate_mc_number(mc_number: str) -> CarrierResponse:
+    """Validate MC number using the FMCSA API"""
+    if not FMCSA_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="FMCSA API key not configured"
+        )
+
+    clean_mc = clean_mc_number(mc_number)
+    
+    try:
+        carrier_data = await fetch_carrier_data(clean_mc)
         carrier_name = carrier_data.get('legalName', carrier_data.get('dbaName', ''))
         dot_number = carrier_data.get('dotNumber')
         
-        if not carrier_name or not dot_number:
-            raise HTTPException(
-                status_code=502,
-                detail="Incomplete carrier data received from FMCSA API"
-            )
-        
         # Determine if carrier is authorized to operate
         is_authorized = carrier_data.get('allowedToOperate') == 'Y'
         status = "Active" if is_authorized else "Inactive"
@@ -159,12 +313,12 @@ def validate_mc_number(mc_number: str) -> CarrierResponse:
                 },
                 "transfer_contact": None,
                 "next_steps": {
-                    "1": f"Confirm you found the right carrier name. Ask user exactly this: '{carrier_name}?'. Then wait for user to respond.",
+                    "1": NEXT_STEPS_1.format(name=carrier_name),
                     "2": {
-                        "a": f"If user confirms: move on to finding available loads, MAKE SURE you do not give them load information until you have verified they work for the carrier {carrier_name}.",
-                        "b": "It is possible that you may have transcribed the name incorrectly, so use your best judgement to decide if the name the caller gives is close enough to the carrier name you have. If so, you can consider it a match and move on to finding available loads.",
-                        "c": "If user denies: first, you must ask the user to repeat the name of the carrier they work for ('I'm sorry, I didn't quite catch that. What's the name of the carrier you work for?'). Wait for the user to provide the name again and check if it matches the carrier name you have.",
-                        "d": "If you still cannot verify the carrier name, ask the user for their MC / DOT number ('I'm sorry, what's that MC number again?'). Wait for user to provide number again. Then search for the carrier again with new number the caller provides."
+                        "a": NEXT_STEPS_2A.format(name=carrier_name),
+                        "b": NEXT_STEPS_2B,
+                        "c": NEXT_STEPS_2C,
+                        "d": NEXT_STEPS_2D
                     }
                 }
             }
@@ -180,84 +334,132 @@ def validate_mc_number(mc_number: str) -> CarrierResponse:
             detail="An unexpected error occurred while processing your request"
         )
 
-def get_load_details(reference_number: str) -> LoadResponse:
+def get_loads_mtime() -> float:
+    """Return the modification time of loads.csv"""
+    try:
+        return LOADS_CSV_PATH.stat().st_mtime
+    except OSError:
+        raise HTTPException(
+            status_code=503,
+            detail="Load data file not available"
+        )
+
+def build_load_index(mtime: float) -> LoadIndex:
     """
-    Retrieve load details from CSV file based on reference number
+    Parse loads.csv into a new index. A file that fails to load is recorded as the index's
+    error, so it is not re-read until its mtime changes.
     """
     try:
-        # Assuming the CSV file is in the same directory as the script
-        csv_path = Path(__file__).parent / "loads.csv"
-        
-        if not csv_path.exists():
-            raise HTTPException(
-                status_code=503,
-                detail="Load data file not available"
-            )
-        
-        try:
-            # Read the CSV file
-            df = pd.read_csv(csv_path)
-        except pd.errors.EmptyDataError:
-            raise HTTPException(
-                status_code=503,
-                detail="Load data file is empty"
-            )
-        except pd.errors.ParserError:
-            raise HTTPException(
-                status_code=503,
-                detail="Error parsing load data file"
-            )
+        loads, load_errors = read_loads_csv()
+        return LoadIndex(mtime=mtime, loads=loads, errors=load_errors)
+    except HTTPException as e:
+        return LoadIndex(mtime=mtime, loads={}, errors={}, error=e)
+
+async def current_loads() -> LoadIndex:
+    """Return the load index, re-reading loads.csv in a worker thread if it has changed"""
+    mtime = get_loads_mtime()
+    if mtime != app.state.load_index.mtime:
+        async with app.state.loads_lock:
+            # Another request may have reloaded the file while this one waited for the lock
+            if mtime != app.state.load_index.mtime:
+                app.state.load_index = await asyncio.to_thread(build_load_index, mtime)
+
+    load_index = app.state.load_index
+    if load_index.error is not None:
+        raise load_index.error.with_traceback(None)
+    return load_index
+
+def read_loads_csv() -> Tuple[Dict[str, LoadDetails], Dict[str, str]]:
+    """
+    Parse loads.csv into loads and per-row errors, both keyed by reference number
+    """
+    # Bad rows are recorded per reference number so they only fail their own lookups
+    loads = {}
+    load_errors = {}
+    try:
+        with LOADS_CSV_PATH.open(encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Load data file is empty"
+                )
+
+            for row in reader:
+                reference_number = row.get('reference_number')
+                if not reference_number:
+                    print(f"Skipping load row without a reference number on line {reader.line_num}")
+                    continue
+
+                # The first row for a reference number wins
+                if reference_number in loads or reference_number in load_errors:
+                    continue
+
+                # Validate required fields
+                missing_fields = [field for field in REQUIRED_LOAD_FIELDS if not row.get(field)]
+                if missing_fields:
+                    load_errors[reference_number] = f"Missing required fields in load data: {', '.join(missing_fields)}"
+                    continue
+
+                try:
+                    loads[reference_number] = LoadDetails(
+                        reference_number=reference_number,
+                        origin=row['origin'],
+                        destination=row['destination'],
+                        equipment_type=row['equipment_type'],
+                        rate=float(row['rate']),
+                        commodity=row['commodity']
+                    )
+                except (ValueError, TypeError) as e:
+                    load_errors[reference_number] = f"Error processing load data: {str(e)}"
+    except OSError:
+        raise HTTPException(
+            status_code=503,
+            detail="Load data file not available"
+        )
+    except (csv.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=503,
+            detail="Error parsing load data file"
+        )
+
+    for reference_number, error in load_errors.items():
+        print(f"Invalid load data for {reference_number}: {error}")
+
+    return loads, load_errors
+
+async def get_load_details(reference_number: str) -> LoadResponse:
+    """
+    Retrieve load details from the cached CSV data based on reference number
+    """
+    try:
+        load_index = await current_loads()
         
         # Validate reference number format
         if not reference_number.startswith('LOAD'):
+            raise INVALID_REFERENCE_NUMBER_ERROR.with_traceback(None)
+        
+        # Rows that failed validation when the file was loaded only fail their own lookup
+        load_error = load_index.errors.get(reference_number)
+        if load_error is not None:
             raise HTTPException(
-                status_code=400,
-                detail="Invalid reference number format. Must start with 'LOAD'"
+                status_code=500,
+                detail=load_error
             )
-        
+
         # Find the load with matching reference number
-        load = df[df['reference_number'] == reference_number]
+        load_details = load_index.loads.get(reference_number)
         
-        if load.empty:
+        if load_details is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Load not found: {reference_number}"
             )
         
-        try:
-            # Convert the first (and should be only) row to a dictionary
-            load_data = load.iloc[0].to_dict()
-            
-            # Validate required fields
-            required_fields = ['reference_number', 'origin', 'destination', 'equipment_type', 'rate', 'commodity']
-            missing_fields = [field for field in required_fields if field not in load_data or pd.isna(load_data[field])]
-            
-            if missing_fields:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Missing required fields in load data: {', '.join(missing_fields)}"
-                )
-            
-            # Create LoadDetails object with validation
-            load_details = LoadDetails(
-                reference_number=str(load_data['reference_number']),
-                origin=str(load_data['origin']),
-                destination=str(load_data['destination']),
-                equipment_type=str(load_data['equipment_type']),
-                rate=float(load_data['rate']),
-                commodity=str(load_data['commodity'])
-            )
-            
-            return LoadResponse(
-                success=True,
-                data=load_details
-            )
-            
-        except (ValueError, TypeError) as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error processing load data: {str(e)}"
-            )
+        return LoadResponse(
+            success=True,
+            data=load_details
+        )
             
     except HTTPException:
         raise
@@ -269,12 +471,120 @@ def get_load_details(reference_number: str) -> LoadResponse:
             detail="An unexpected error occurred while processing your request"
         )
 
+async def get_loads_details(reference_numbers: List[str]) -> LoadsResponse:
+    """
+    Retrieve details for several loads from the cached CSV data, in request order
+    """
+    try:
+        load_index = await current_loads()
+        loads = load_index.loads
+
+        # Validate reference number format
+        if not all(reference_number.startswith('LOAD') for reference_number in reference_numbers):
+            raise INVALID_REFERENCE_NUMBER_ERROR.with_traceback(None)
+
+        # Rows that failed validation when the file was loaded are reported per reference number
+        found = []
+        not_found = []
+        errors = {}
+        for reference_number in reference_numbers:
+            if reference_number in loads:
+                found.append(loads[reference_number])
+            elif reference_number in load_index.errors:
+                errors[reference_number] = load_index.errors[reference_number]
+            else:
+                not_found.append(reference_number)
+
+        return LoadsResponse(
+            success=not errors,
+            data=found,
+            not_found=not_found,
+            errors=errors
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Log unexpected errors and return 500
+        print(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail="An unexpected error occurred while processing your request"
+        )
+
 @app.get("/api/v1/carriers/validate/{mc_number}", response_model=CarrierResponse)
 async def validate_carrier(mc_number: str):
     """Validate a carrier's MC number"""
-    return validate_mc_number(mc_number)
+    carrier = await validate_mc_number(mc_number)
+    # The response is already validated, so skip FastAPI's response_model pass
+    return ORJSONResponse(carrier.model_dump(by_alias=True))
+
+@app.post("/api/v1/carriers/validate", response_model=List[BulkCarrierResult])
+async def validate_carriers(mc_numbers: List[str] = Body(...)):
+    """Validate a batch of carrier MC numbers concurrently, preserving input order"""
+    if len(mc_numbers) > MAX_BULK_MC_NUMBERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many MC numbers. Maximum is {MAX_BULK_MC_NUMBERS} per request"
+        )
+
+    async def validate_one(mc_number: str) -> BulkCarrierResult:
+        try:
+            carrier = await validate_mc_number(mc_number)
+            return BulkCarrierResult(success=True, data=carrier.data)
+        except HTTPException as e:
+            return BulkCarrierResult(success=False, error=e.detail)
+
+    # Normalize up front so variants of the same MC number ("555", "MC-555") share one lookup
+    clean_mcs: Dict[int, str] = {}
+    format_errors: Dict[int, str] = {}
+    for i, mc_number in enumerate(mc_numbers):
+        try:
+            clean_mcs[i] = clean_mc_number(mc_number)
+        except HTTPException as e:
+            format_errors[i] = e.detail
+
+    unique_mcs = list(dict.fromkeys(clean_mcs.values()))
+    lookups = dict(zip(unique_mcs, await asyncio.gather(*(validate_one(clean_mc) for clean_mc in unique_mcs))))
+
+    results = [
+        lookups[clean_mcs[i]] if i in clean_mcs else BulkCarrierResult(success=False, error=format_errors[i])
+        for i in range(len(mc_numbers))
+    ]
+    return ORJSONResponse([result.model_dump(by_alias=True) for result in results])
 
 @app.get("/api/v1/loads/{reference_number}", response_model=LoadResponse)
 async def get_load(reference_number: str):
     """Retrieve load details by reference number"""
-    return get_load_details(reference_number)
\ No newline at end of file
+    return await get_load_details(reference_number)
+
+@app.get("/api/v1/loads", response_model=LoadsResponse)
+async def get_loads(refs: List[str] = Query(default=[])):
+    """Retrieve several loads by reference number, given as repeated or comma-separated refs"""
+    # Drop duplicates while keeping request order
+    reference_numbers = list(dict.fromkeys(ref.strip() for value in refs for ref in value.split(',') if ref.strip()))
+    if not reference_numbers:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one reference number is required"
+        )
+    if len(reference_numbers) > MAX_BULK_REFERENCE_NUMBERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many reference numbers. Maximum is {MAX_BULK_REFERENCE_NUMBERS} per request"
+        )
+    return await get_loads_details(reference_numbers)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools replace the pure-Python event loop and HTTP parser; equivalent to
+    # `uvicorn app:app --loop uvloop --http httptools --workers N`
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8000)),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1))
+    )